@@ -6,10 +6,157 @@ It implements a base CRUD class with common operations and specialized classes
 for each model with their specific query methods.
 """
 
-from sqlalchemy import func
+from collections import defaultdict
+
+import pandas as pd
+from sqlalchemy import String, bindparam, cast, func, lambda_stmt, literal, select, update
 from sqlalchemy.orm import Session
 from models import StoreStatus, TimeZones, StoreReport, BusinessHours
 
+# Module-level SELECT statements with bind parameters.
+# Hoisting these out of the methods means the statement objects are built once
+# and SQLAlchemy's compiled-SQL cache can reuse the compiled form on every
+# call, instead of rebuilding and recompiling a fresh Query each time.
+# The two statements on the report hot path additionally use lambda
+# statements: the select() construction and its cache-key computation run
+# only on the first call, so repeated executions only swap bind parameters.
+_REPORT_BY_ID_STMT = lambda_stmt(
+    lambda: select(StoreReport).where(StoreReport.report_id == bindparam("rid"))
+)
+
+# Selecting just the two columns the report reads returns lightweight Row
+# tuples instead of fully hydrated ORM instances, skipping per-row
+# object construction and identity-map bookkeeping on the hottest query.
+_STATUS_RANGE_STMT = lambda_stmt(
+    lambda: select(StoreStatus.timestamp_utc, StoreStatus.status)
+    .where(
+        StoreStatus.store_id == bindparam("sid"),
+        StoreStatus.timestamp_utc >= bindparam("start_time"),
+        StoreStatus.timestamp_utc <= bindparam("end_time"),
+    )
+    .order_by(StoreStatus.timestamp_utc)
+)
+
+# MAX and COUNT together identify the loaded dataset: both only change
+# when the loader runs, and one aggregate scan is enough for both. The MAX
+# doubles as the report's "current time", so the window end and the
+# fingerprint always describe the same snapshot.
+_DATA_FINGERPRINT_STMT = select(func.max(StoreStatus.timestamp_utc), func.count())
+
+# The Running row is inserted by the API at trigger time (so the id
+# resolves immediately); the worker stamps the fingerprint afterwards.
+_SET_FINGERPRINT_STMT = (
+    update(StoreReport)
+    .where(StoreReport.report_id == bindparam("rid"))
+    .values(data_fingerprint=bindparam("fp"))
+)
+
+_COMPLETED_BY_FINGERPRINT_STMT = (
+    select(StoreReport.report_data, StoreReport.report_data_json)
+    .where(
+        StoreReport.status == 'Complete',
+        StoreReport.data_fingerprint == bindparam("fp"),
+    )
+    .order_by(StoreReport.created_at.desc())
+    .limit(1)
+)
+
+_STATUS_SINCE_STMT = (
+    select(StoreStatus.store_id, StoreStatus.timestamp_utc, StoreStatus.status)
+    .where(StoreStatus.timestamp_utc >= bindparam("start_time"))
+    .order_by(StoreStatus.store_id, StoreStatus.timestamp_utc)
+)
+
+_TIMEZONE_STMT = select(TimeZones).where(TimeZones.store_id == bindparam("sid"))
+
+_BUSINESS_HOURS_STMT = select(BusinessHours).where(BusinessHours.store_id == bindparam("sid"))
+
+_UPDATE_REPORT_STMT = (
+    update(StoreReport)
+    .where(StoreReport.report_id == bindparam("rid"))
+    .values(
+        status=bindparam("new_status"),
+        report_data=bindparam("new_data"),
+        report_data_json=bindparam("new_data_json"),
+    )
+)
+
+# Every store that must appear in a report, deduplicated by the database.
+# UNION (as opposed to UNION ALL) makes SQLite deduplicate while merging,
+# so only the distinct ids cross into Python instead of three full columns
+# that then need a Python-side set union.
+_ALL_STORE_IDS_STMT = (
+    select(TimeZones.store_id)
+    .union(
+        select(BusinessHours.store_id),
+        select(StoreStatus.store_id),
+    )
+)
+
+# Tagged union of the two reference tables the report worker needs at
+# startup. SQLite's per-statement overhead (lock, parse, plan) dominates
+# tiny queries, so fetching both tables in one round trip is cheaper than
+# two separate SELECTs; rows are told apart by the literal 'kind' column.
+_REFERENCE_DATA_STMT = (
+    select(
+        literal('tz').label('kind'),
+        TimeZones.store_id,
+        TimeZones.timezone_str.label('val1'),
+        literal(None).label('val2'),
+        literal(None).label('val3'),
+    )
+    .union_all(
+        select(
+            literal('bh'),
+            BusinessHours.store_id,
+            cast(BusinessHours.day_of_week, String),
+            BusinessHours.start_time_local,
+            BusinessHours.end_time_local,
+        )
+    )
+)
+
+def get_all_store_ids(db: Session) -> list:
+    """
+    Fetch the distinct store ids across all three source tables.
+
+    A store can appear in any of the timezone, business-hours or status
+    tables, so the report must union all three. Doing the union in SQL
+    returns each id exactly once instead of materializing three full
+    columns in Python and set-unioning them there.
+
+    Args:
+        db: Database session
+
+    Returns:
+        List of distinct store ids
+    """
+    return list(db.execute(_ALL_STORE_IDS_STMT).scalars())
+
+def get_report_reference_data(db: Session) -> tuple[dict[str, str], dict[str, dict[int, tuple]]]:
+    """
+    Fetch all store timezones and business hours in a single round trip.
+
+    The report worker needs both tables up front; combining them into one
+    tagged UNION ALL query halves the per-statement overhead compared to
+    issuing the two bulk SELECTs separately.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Tuple of (timezone dict keyed by store_id, business-hours dict
+        keyed by store_id mapping day_of_week to (start, end) tuples)
+    """
+    tz_by_store: dict[str, str] = {}
+    hours_by_store: dict[str, dict[int, tuple]] = defaultdict(dict)
+    for kind, store_id, val1, val2, val3 in db.execute(_REFERENCE_DATA_STMT):
+        if kind == 'tz':
+            tz_by_store[store_id] = val1
+        else:
+            hours_by_store[store_id][int(val1)] = (val2, val3)
+    return tz_by_store, dict(hours_by_store)
+
 class CRUDBase:
     """
     Base CRUD class providing common database operations.
@@ -92,31 +239,70 @@ class StoreReportCRUD(CRUDBase):
         Returns:
             StoreReport instance if found, None otherwise
         """
-        return db.query(self.model).filter(self.model.report_id == report_id).first()
-    
-    def update_report(self, db: Session, report_id: str, status: str, data: str):
+        return db.execute(_REPORT_BY_ID_STMT, {"rid": report_id}).scalars().first()
+
+    def set_fingerprint(self, db: Session, report_id: str, fingerprint: str) -> None:
+        """
+        Stamp a report row with its data fingerprint.
+
+        The row itself is created by the API when the report is triggered;
+        the worker records the fingerprint once it has scanned the data.
+
+        Args:
+            db: Database session
+            report_id: Unique report identifier
+            fingerprint: Data fingerprint from get_data_fingerprint
+        """
+        db.execute(_SET_FINGERPRINT_STMT, {"rid": report_id, "fp": fingerprint})
+        db.commit()
+
+    def get_completed_by_fingerprint(self, db: Session, fingerprint: str):
+        """
+        Find the newest completed report built from the same dataset.
+
+        Args:
+            db: Database session
+            fingerprint: Data fingerprint from get_data_fingerprint
+
+        Returns:
+            (report_data, report_data_json) Row of the matching report,
+            or None if no completed report carries this fingerprint
+        """
+        return db.execute(_COMPLETED_BY_FINGERPRINT_STMT, {"fp": fingerprint}).first()
+
+    def update_report(self, db: Session, report_id: str, status: str, data: bytes,
+                      data_json: bytes | None = None) -> int:
         """
         Update the status and data of an existing report.
-        
+
         This method is used to mark reports as complete and store the
-        generated CSV data.
-        
+        generated CSV data. It issues a single UPDATE statement rather
+        than loading, mutating and refreshing the ORM instance, which
+        would cost three round-trips. The caller supplies the blob
+        already gzip-compressed - the report worker streams the CSV
+        through gzip as it is written - so it is stored as passed.
+
         Args:
             db: Database session
             report_id: Unique report identifier
             status: New status ('Running', 'Complete', 'Failed')
-            data: Report data (CSV content when complete)
-            
+            data: gzip-compressed report data (CSV content when complete)
+            data_json: Optional pre-serialized JSON form of the report rows
+
         Returns:
-            Updated StoreReport instance if found, None otherwise
+            Number of rows updated (0 if the report does not exist)
         """
-        report = self.get_report_by_id(db, report_id)
-        if report:
-            setattr(report, 'status', status)
-            setattr(report, 'report_data', data)
-            db.commit()
-            db.refresh(report)
-        return report
+        result = db.execute(
+            _UPDATE_REPORT_STMT,
+            {
+                "rid": report_id,
+                "new_status": status,
+                "new_data": data,
+                "new_data_json": data_json,
+            }
+        )
+        db.commit()
+        return result.rowcount
 
 class StoreStatusCRUD(CRUDBase):
     """
@@ -127,43 +313,65 @@ class StoreStatusCRUD(CRUDBase):
     the latest timestamp in the dataset.
     """
 
-    def get_store_status(self, db: Session, store_id: int, start_time: str, end_time: str):
+    def get_store_status(self, db: Session, store_id: int, start_time: int, end_time: int):
         """
         Retrieve store status records within a specific time range.
-        
+
         This method is used to get all status polls for a store between
         two timestamps, ordered chronologically.
-        
+
         Args:
             db: Database session
             store_id: Store identifier
-            start_time: Start timestamp (ISO format)
-            end_time: End timestamp (ISO format)
-            
+            start_time: Start timestamp (UTC epoch seconds)
+            end_time: End timestamp (UTC epoch seconds)
+
         Returns:
-            List of StoreStatus records ordered by timestamp
+            List of (timestamp_utc, status) Row tuples ordered by timestamp
         """
-        return db.query(self.model).filter(
-            self.model.store_id == store_id,
-            self.model.timestamp_utc >= start_time,
-            self.model.timestamp_utc <= end_time
-        ).order_by(self.model.timestamp_utc).all()
+        return db.execute(
+            _STATUS_RANGE_STMT,
+            {"sid": store_id, "start_time": start_time, "end_time": end_time}
+        ).all()
 
-    def get_max_timestamp(self, db: Session) -> str:
+    def get_data_fingerprint(self, db: Session) -> tuple[str, int]:
         """
-        Get the latest timestamp from all store status records.
-        
-        This is used to determine the "current time" for report generation
-        since we're working with historical data.
-        
+        Compute a fingerprint identifying the currently loaded dataset.
+
+        The status table only changes when scripts/load_data.py runs, so
+        its latest timestamp plus its row count pin down the data a report
+        was generated from. Reports carrying the same fingerprint were
+        built from identical input and can be reused. The latest timestamp
+        is returned alongside so the report window end always comes from
+        the same snapshot the fingerprint describes.
+
         Args:
             db: Database session
-            
+
+        Returns:
+            Tuple of (fingerprint "<max timestamp>:<row count>", latest
+            status timestamp in UTC epoch seconds)
+        """
+        max_ts, row_count = db.execute(_DATA_FINGERPRINT_STMT).one()
+        return f"{max_ts}:{row_count}", max_ts
+
+    def get_all_status_since(self, db: Session, start_time: int) -> pd.DataFrame:
+        """
+        Load all status polls at or after a timestamp into a DataFrame.
+
+        The report only looks at the trailing week of polls, so bounding
+        the bulk load to the report window avoids fetching and grouping
+        history that would be discarded anyway.
+
+        Args:
+            db: Database session
+            start_time: Earliest timestamp to include (UTC epoch seconds)
+
         Returns:
-            Latest timestamp string from the dataset
+            DataFrame with store_id, timestamp_utc and status columns,
+            ordered by (store_id, timestamp_utc)
         """
-        result = db.query(func.max(self.model.timestamp_utc)).scalar()
-        return result
+        return pd.read_sql(_STATUS_SINCE_STMT, db.get_bind(), params={"start_time": start_time})
 
 class StoreTimezoneCRUD(CRUDBase):
     """
@@ -185,7 +393,7 @@ class StoreTimezoneCRUD(CRUDBase):
             Timezone string if found, None if no timezone data exists
             (caller should default to 'America/Chicago')
         """
-        result = db.query(self.model).filter(self.model.store_id == store_id).first()
+        result = db.execute(_TIMEZONE_STMT, {"sid": store_id}).scalars().first()
         return result.timezone_str if result else None
 
 class StoreBusinessHoursCRUD(CRUDBase):
@@ -209,7 +417,7 @@ class StoreBusinessHoursCRUD(CRUDBase):
             Returns None if no business hours data exists for the store
             (caller should default to 24/7 operation)
         """
-        results = db.query(self.model).filter(self.model.store_id == store_id).all()
+        results = db.execute(_BUSINESS_HOURS_STMT, {"sid": store_id}).scalars().all()
         if not results:
             return None
         return {result.day_of_week: (result.start_time_local, result.end_time_local) for result in results}
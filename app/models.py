@@ -5,7 +5,7 @@ This module defines the database schema for the store monitoring system.
 It includes models for store status, business hours, timezones, and generated reports.
 """
 
-from sqlalchemy import Column, DateTime, Integer, String, JSON
+from sqlalchemy import Column, DateTime, Index, Integer, LargeBinary, String, text
 from sqlalchemy.orm import DeclarativeBase
 
 # Base class for all SQLAlchemy ORM models
@@ -23,6 +23,10 @@ class StoreStatus(Base):
     """
     __tablename__ = "store_status"
 
+    # Composite index so the per-store time-range query used during report
+    # generation is an index seek instead of a scan of all rows for the store
+    __table_args__ = (Index('ix_status_store_ts', 'store_id', 'timestamp_utc'),)
+
     # Primary key - auto-incrementing ID
     id = Column(Integer, primary_key=True, autoincrement=True)
     
@@ -32,8 +36,10 @@ class StoreStatus(Base):
     # Status of the store: 'active' or 'inactive'
     status = Column(String, nullable=False)
     
-    # Timestamp when the status was recorded (UTC format)
-    timestamp_utc = Column(String, nullable=False)
+    # Timestamp when the status was recorded, as UTC epoch seconds.
+    # Integers keep range comparisons and index entries cheap compared to
+    # the ISO strings shipped in the source CSV.
+    timestamp_utc = Column(Integer, nullable=False)
 
 class BusinessHours(Base):
     """
@@ -44,7 +50,10 @@ class BusinessHours(Base):
     If no data exists for a store, it's assumed to be open 24/7.
     """
     __tablename__ = "business_hours"
-    
+
+    # Composite index for the per-store business-hours lookup
+    __table_args__ = (Index('ix_bh_store_dow', 'store_id', 'day_of_week'),)
+
     # Primary key - auto-incrementing ID
     id = Column(Integer, primary_key=True, autoincrement=True)
     
@@ -84,14 +93,35 @@ class StoreReport(Base):
     """
     __tablename__ = "store_report"
 
+    # Partial index over in-flight reports only: scans for status='Running'
+    # (e.g. a sweeper for stuck reports) stay O(log N) however many
+    # completed reports accumulate, while writes to finished rows skip
+    # index maintenance entirely
+    __table_args__ = (
+        Index('ix_report_running', 'status', sqlite_where=text("status='Running'")),
+        Index('ix_report_fingerprint', 'data_fingerprint'),
+    )
+
     # Unique report identifier - serves as primary key
     report_id = Column(String, primary_key=True)
-    
+
     # Report status: 'Running', 'Complete', or 'Failed'
     status = Column(String, nullable=False)
-    
-    # Generated report data stored as JSON (CSV content when complete)
-    report_data = Column(JSON, nullable=True)
+
+    # Fingerprint of the source data the report was built from, as
+    # "<max timestamp>:<row count>" of the status table. The dataset only
+    # changes when the loader runs, so a completed report with the same
+    # fingerprint can be reused verbatim instead of recomputed.
+    data_fingerprint = Column(String, nullable=True)
+    
+    # Generated report data stored as gzip-compressed bytes (CSV content
+    # when complete). CSV compresses very well, so this cuts stored bytes
+    # and read I/O by roughly an order of magnitude versus plain text.
+    report_data = Column(LargeBinary, nullable=True)
+
+    # The same report rows pre-serialized with orjson, so the JSON response
+    # format is served as a stored blob instead of re-encoding per request
+    report_data_json = Column(LargeBinary, nullable=True)
     
     # Timestamp when the report generation was initiated
     created_at = Column(DateTime, nullable=False)
\ No newline at end of file
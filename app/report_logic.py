@@ -14,215 +14,422 @@ The main algorithm:
 6. Aggregate uptime/downtime for different time periods
 
 Functions:
-    process_single_store: Worker function to calculate metrics for a single store
-    generate_report_parallel: Orchestrator function to manage parallel report generation
+    compute_report_metrics: Vectorized metric computation for all stores at once
+    generate_report_parallel: Orchestrator function to manage report generation
     get_report_status: Retrieve current status and data of a report
 """
 
+import csv
+import gzip
 import io
+import numpy as np
+import orjson
 import pandas as pd
-from uuid import UUID
-from crud import store_status_crud, store_timezone_crud, store_report_crud, store_business_hours_crud
-from models import StoreReport
-from database import SessionLocal
-from datetime import datetime, timedelta, time
-import pytz
-import concurrent.futures
+from crud import (
+    get_all_store_ids,
+    get_report_reference_data,
+    store_status_crud,
+    store_report_crud,
+)
+from database import ReportSessionLocal, SessionLocal
+from datetime import datetime, timedelta, time, timezone
+from zoneinfo import ZoneInfo
 import time as timer
+from functools import lru_cache
 
-# --- WORKER FUNCTION ---
-# This function contains the logic to process exactly ONE store.
-# It's designed to be run in a separate process.
-def process_single_store(args: tuple):
+# Column order for the generated report CSV
+REPORT_FIELDS = [
+    "store_id",
+    "uptime_last_hour",
+    "uptime_last_day",
+    "uptime_last_week",
+    "downtime_last_hour",
+    "downtime_last_day",
+    "downtime_last_week",
+]
+
+def _tz(name: str) -> ZoneInfo:
+    """
+    Return the timezone object for a tz database name.
+
+    ZoneInfo maintains its own per-key instance cache in the stdlib, so
+    repeated lookups for the handful of timezone strings shared by
+    thousands of stores are already dict hits - no extra caching layer
+    is needed here.
     """
-    Calculates uptime and downtime metrics for a single store.
-    
-    This worker function is designed to run in parallel processes and calculates
-    store metrics based on business hours, timezone, and status polling data.
-    
+    return ZoneInfo(name)
+
+# Parsed stand-in for a day with no business-hours row: open 24/7
+_OPEN_ALL_DAY = (time(0, 0, 0), time(23, 59, 59))
+
+def _parse_business_hours(business_hours: dict | None) -> tuple:
+    """
+    Convert a store's business-hours dict to a fixed 7-slot tuple.
+
+    Parsing the HH:MM:SS strings once per store and indexing a tuple by
+    weekday replaces repeated dict lookups and time.fromisoformat calls in
+    the interval-building loop.
+
     Args:
-        args: Tuple containing (store_id, max_timestamp_utc)
-            - store_id: Unique identifier for the store
-            - max_timestamp_utc: Maximum timestamp to calculate metrics up to
-    
+        business_hours: Dict of day_of_week to (start, end) tuples, or None for 24/7
+
     Returns:
-        dict: Store metrics containing:
-            - store_id: Store identifier
-            - uptime_last_hour: Minutes of uptime in the last hour
-            - uptime_last_day: Hours of uptime in the last day
-            - uptime_last_week: Hours of uptime in the last week
-            - downtime_last_hour: Minutes of downtime in the last hour
-            - downtime_last_day: Hours of downtime in the last day
-            - downtime_last_week: Hours of downtime in the last week
+        7-tuple indexed by weekday holding (start_time, end_time) pairs of
+        datetime.time objects, or None for closed days
     """
-    store_id, max_timestamp_utc = args
-    
-    # Each parallel process must create its own database session.
-    db = SessionLocal()
-    try:
-        store_timezone_str = store_timezone_crud.get_store_timezone(db, store_id) or "America/Chicago"
-        store_tz = pytz.timezone(store_timezone_str)
-
-        business_hours = store_business_hours_crud.get_business_hours(db, store_id)
-        if business_hours is None:
-            business_hours = {day: ('00:00:00', '23:59:59') for day in range(7)}
-
-        start_of_week = max_timestamp_utc - timedelta(days=7)
-        status_polls = store_status_crud.get_store_status(db, store_id, start_of_week.isoformat(), max_timestamp_utc.isoformat())
-
-        business_intervals_utc = []
-        for i in range(7):
-            day = max_timestamp_utc - timedelta(days=i)
-            day_of_week = day.weekday()
-            if day_of_week in business_hours:
-                start_time_str, end_time_str = business_hours[day_of_week]
-                start_time = time.fromisoformat(start_time_str)
-                end_time = time.fromisoformat(end_time_str)
-                start_local = store_tz.localize(datetime.combine(day.date(), start_time))
-                end_local = store_tz.localize(datetime.combine(day.date(), end_time))
-                business_intervals_utc.append((start_local.astimezone(pytz.utc), end_local.astimezone(pytz.utc)))
-
-        total_uptime = timedelta(0)
-        total_downtime = timedelta(0)
-
-        last_poll_time = start_of_week
-        current_status = status_polls[0].status if status_polls else "active"
-
-        for poll in status_polls:
-            if ' UTC' in poll.timestamp_utc:
-                poll_time = datetime.strptime(poll.timestamp_utc, '%Y-%m-%d %H:%M:%S.%f %Z')
-            else:
-                poll_time = datetime.fromisoformat(poll.timestamp_utc)
-            if poll_time.tzinfo is None:
-                poll_time = pytz.utc.localize(poll_time)
-
-            status_interval_start = last_poll_time
-            status_interval_end = poll_time
-
-            for biz_start, biz_end in business_intervals_utc:
-                overlap_start = max(status_interval_start, biz_start)
-                overlap_end = min(status_interval_end, biz_end)
-                if overlap_start < overlap_end:
-                    overlap_duration = overlap_end - overlap_start
-                    if current_status == "active":
-                        total_uptime += overlap_duration
-                    else:
-                        total_downtime += overlap_duration
-            
-            last_poll_time = poll_time
-            current_status = poll.status
-        
-        for biz_start, biz_end in business_intervals_utc:
-            overlap_start = max(last_poll_time, biz_start)
-            overlap_end = min(max_timestamp_utc, biz_end)
-            if overlap_start < overlap_end:
-                overlap_duration = overlap_end - overlap_start
-                if current_status == "active":
-                    total_uptime += overlap_duration
-                else:
-                    total_downtime += overlap_duration
-
-        uptime_last_day = total_uptime if max_timestamp_utc - start_of_week <= timedelta(days=1) else (total_uptime / 7)
-        downtime_last_day = total_downtime if max_timestamp_utc - start_of_week <= timedelta(days=1) else (total_downtime / 7)
-        uptime_last_hour = uptime_last_day if max_timestamp_utc - start_of_week <= timedelta(hours=1) else (uptime_last_day / 24)
-        downtime_last_hour = downtime_last_day if max_timestamp_utc - start_of_week <= timedelta(hours=1) else (downtime_last_day / 24)
-
-        return {
-            "store_id": store_id,
-            "uptime_last_hour": round(uptime_last_hour.total_seconds() / 60, 2),
-            "uptime_last_day": round(uptime_last_day.total_seconds() / 3600, 2),
-            "uptime_last_week": round(total_uptime.total_seconds() / 3600, 2),
-            "downtime_last_hour": round(downtime_last_hour.total_seconds() / 60, 2),
-            "downtime_last_day": round(downtime_last_day.total_seconds() / 3600, 2),
-            "downtime_last_week": round(total_downtime.total_seconds() / 3600, 2),
-        }
-    finally:
-        db.close()
+    if business_hours is None:
+        return (_OPEN_ALL_DAY,) * 7
+
+    parsed = []
+    for day in range(7):
+        pair = business_hours.get(day)
+        parsed.append(
+            (time.fromisoformat(pair[0]), time.fromisoformat(pair[1])) if pair else None
+        )
+    return tuple(parsed)
+
+@lru_cache(maxsize=4096)
+def _cached_business_intervals(tz_name: str, hours_by_weekday: tuple, end_ts: int) -> tuple:
+    """
+    Build and cache the UTC business intervals for one schedule.
+
+    Many stores share the same timezone and weekly schedule, and the
+    window end is identical for every store in a report, so memoizing on
+    (timezone, parsed hours, window end) means the per-day offset lookups
+    run once per distinct schedule rather than once per store.
+
+    Args:
+        tz_name: Timezone name (resolved, never None)
+        hours_by_weekday: 7-slot tuple from _parse_business_hours
+        end_ts: End of the report window (UTC epoch seconds)
+
+    Returns:
+        Tuple of (start, end) pairs in UTC epoch seconds, one per open day,
+        clipped to the 7-day report window
+    """
+    store_tz = _tz(tz_name)
+    max_timestamp_utc = datetime.fromtimestamp(end_ts, tz=timezone.utc)
+    start_ts = end_ts - 7 * 86400
+
+    intervals = []
+    # A 7-day window generally straddles 8 local calendar dates (9 for
+    # timezones east of UTC, whose local date can run ahead of the UTC
+    # one), so iterate one day beyond each edge and clip to the window;
+    # building only 7 day-instances used to drop the partial day at the
+    # window start.
+    for i in range(-1, 8):
+        day = max_timestamp_utc - timedelta(days=i)
+        pair = hours_by_weekday[day.weekday()]
+        if pair is not None:
+            start_time, end_time = pair
+            # The UTC offset only moves at DST transitions, which never
+            # land at local noon, so one offset lookup per day covers both
+            # endpoints and each conversion is integer arithmetic instead
+            # of a timezone transition search per conversion.
+            date = day.date()
+            offset_s = int(
+                store_tz.utcoffset(datetime.combine(date, time(12, 0))).total_seconds()
+            )
+            midnight_epoch = int(
+                datetime.combine(date, time(0), tzinfo=timezone.utc).timestamp()
+            )
+            open_s = max(
+                midnight_epoch - offset_s + start_time.hour * 3600
+                + start_time.minute * 60 + start_time.second,
+                start_ts,
+            )
+            close_s = min(
+                midnight_epoch - offset_s + end_time.hour * 3600
+                + end_time.minute * 60 + end_time.second,
+                end_ts,
+            )
+            if open_s < close_s:
+                intervals.append((open_s, close_s))
+    return tuple(intervals)
+
+def _business_intervals_utc(store_timezone_str: str | None, business_hours: dict | None,
+                            end_ts: int) -> tuple:
+    """
+    Build a store's business-hour intervals for the past 7 days in UTC.
+
+    Args:
+        store_timezone_str: Store timezone string, or None to use the default
+        business_hours: Dict of day_of_week to (start, end) tuples, or None for 24/7
+        end_ts: End of the report window (UTC epoch seconds)
+
+    Returns:
+        Tuple of (start, end) pairs in UTC epoch seconds, one per open day
+    """
+    return _cached_business_intervals(
+        store_timezone_str or "America/Chicago",
+        _parse_business_hours(business_hours),
+        end_ts,
+    )
+
+def compute_report_metrics(all_store_ids: list, polls_df: pd.DataFrame,
+                           tz_by_store: dict, hours_by_store: dict,
+                           end_ts: int) -> list[dict]:
+    """
+    Compute uptime and downtime metrics for every store in one vectorized pass.
+
+    Status intervals for every store are derived from the windowed polls
+    with boundary masks on flat arrays. Business-hour coverage is then
+    evaluated with a prefix-sum sweep: each store's business intervals are
+    laid out on a single global axis (store index times the window span),
+    so "open seconds before t" is one binary search plus a cumulative-sum
+    lookup, and each status interval's overlap is the difference of two
+    such lookups. That is O((P+B) log B) for P status intervals and B
+    business intervals, instead of pairing every status interval with all
+    7 of its store's business intervals.
+
+    Args:
+        all_store_ids: Every store that must appear in the report
+        polls_df: Status polls for the report window, ordered by
+            (store_id, timestamp_utc), with epoch-second timestamps
+        tz_by_store: store_id -> timezone string
+        hours_by_store: store_id -> day_of_week -> (start, end) tuples
+        end_ts: End of the report window (UTC epoch seconds)
+
+    Returns:
+        List of per-store metric dicts with uptime/downtime for the last
+        hour (minutes), day (hours) and week (hours)
+    """
+    # All interval arithmetic below is plain int64 epoch seconds; datetimes
+    # only appear when localizing business hours.
+    start_ts = end_ts - 7 * 86400
+    # Width of one store's band on the global axis (window plus a gap so
+    # neighbouring stores' coordinates can never touch)
+    span = end_ts - start_ts + 1
+
+    n_stores = len(all_store_ids)
+    store_index = {store_id: k for k, store_id in enumerate(all_store_ids)}
+
+    poll_store = polls_df['store_id'].map(store_index).to_numpy(np.int64)
+    poll_ts = polls_df['timestamp_utc'].to_numpy(np.int64)
+    poll_active = polls_df['status'].to_numpy() == 'active'
+
+    # Status intervals. Each poll opens an interval that runs until the next
+    # poll of the same store (or the end of the window) and carries that
+    # poll's status; a leading interval per store extrapolates the first
+    # poll's status back to the window start, and a store with no polls at
+    # all counts as active for the whole window.
+    n_polls = len(poll_ts)
+    if n_polls:
+        first_mask = np.empty(n_polls, dtype=bool)
+        first_mask[0] = True
+        first_mask[1:] = poll_store[1:] != poll_store[:-1]
+        last_mask = np.empty(n_polls, dtype=bool)
+        last_mask[-1] = True
+        last_mask[:-1] = first_mask[1:]
+
+        next_ts = np.empty(n_polls, dtype=np.int64)
+        next_ts[:-1] = poll_ts[1:]
+        next_ts[last_mask] = end_ts
+    else:
+        first_mask = last_mask = np.empty(0, dtype=bool)
+        next_ts = np.empty(0, dtype=np.int64)
+
+    polled = np.zeros(n_stores, dtype=bool)
+    polled[poll_store] = True
+    missing_stores = np.nonzero(~polled)[0]
+
+    interval_store = np.concatenate((poll_store, poll_store[first_mask], missing_stores))
+    interval_start = np.concatenate((
+        poll_ts,
+        np.full(first_mask.sum(), start_ts, dtype=np.int64),
+        np.full(len(missing_stores), start_ts, dtype=np.int64),
+    ))
+    interval_end = np.concatenate((
+        next_ts,
+        poll_ts[first_mask],
+        np.full(len(missing_stores), end_ts, dtype=np.int64),
+    ))
+    interval_active = np.concatenate((
+        poll_active,
+        poll_active[first_mask],
+        np.ones(len(missing_stores), dtype=bool),
+    ))
+
+    # Business intervals for every store, clamped to the report window and
+    # shifted into each store's band on the global axis.
+    biz_store, biz_start, biz_end = [], [], []
+    for store_id in all_store_ids:
+        k = store_index[store_id]
+        for s, e in _business_intervals_utc(
+                tz_by_store.get(store_id), hours_by_store.get(store_id), end_ts):
+            biz_store.append(k)
+            biz_start.append(s)
+            biz_end.append(e)
+
+    biz_store = np.array(biz_store, dtype=np.int64)
+    biz_start = np.clip(np.array(biz_start, dtype=np.int64), start_ts, end_ts)
+    biz_end = np.clip(np.array(biz_end, dtype=np.int64), start_ts, end_ts)
+
+    global_biz_start = biz_store * span + (biz_start - start_ts)
+    global_biz_end = biz_store * span + (biz_end - start_ts)
+
+    # Business intervals are disjoint within a store, so sorting the starts
+    # keeps each (start, end) pair aligned and yields one globally sorted
+    # sequence of open intervals with a running total of open seconds.
+    order = np.argsort(global_biz_start, kind='stable')
+    global_biz_start = global_biz_start[order]
+    global_biz_end = global_biz_end[order]
+    open_before = np.concatenate(([0], np.cumsum(global_biz_end - global_biz_start)))
+
+    def _open_seconds_until(coords: np.ndarray) -> np.ndarray:
+        """Total open seconds on the global axis before each coordinate."""
+        j = np.searchsorted(global_biz_start, coords, side='right') - 1
+        jj = np.maximum(j, 0)
+        partial = np.clip(
+            np.minimum(coords, global_biz_end[jj]) - global_biz_start[jj], 0, None
+        )
+        return np.where(j >= 0, open_before[jj] + partial, 0)
+
+    # Each status interval's business-hours overlap is the difference of
+    # the cumulative open time at its two endpoints.
+    band = interval_store * span - start_ts
+    overlap = (
+        _open_seconds_until(band + interval_end)
+        - _open_seconds_until(band + interval_start)
+    )
+
+    up = np.bincount(
+        interval_store[interval_active],
+        weights=overlap[interval_active],
+        minlength=n_stores,
+    ).astype(np.int64)
+    down = np.bincount(
+        interval_store[~interval_active],
+        weights=overlap[~interval_active],
+        minlength=n_stores,
+    ).astype(np.int64)
+
+    result = pd.DataFrame({'store_id': all_store_ids})
+
+    # The report window is a fixed 7 days: extrapolate day and hour metrics
+    # from the weekly totals exactly as the per-store loop used to.
+    result['uptime_last_hour'] = np.round(up / 7 / 24 / 60, 2)
+    result['uptime_last_day'] = np.round(up / 7 / 3600, 2)
+    result['uptime_last_week'] = np.round(up / 3600, 2)
+    result['downtime_last_hour'] = np.round(down / 7 / 24 / 60, 2)
+    result['downtime_last_day'] = np.round(down / 7 / 3600, 2)
+    result['downtime_last_week'] = np.round(down / 3600, 2)
+
+    return result.to_dict('records')
 
 # --- ORCHESTRATOR FUNCTION ---
 # This function replaces the old generate_report function.
-def generate_report_parallel(report_id: UUID):
+def generate_report_parallel(report_id: str):
     """
-    Orchestrates parallel report generation for all stores.
-    
+    Orchestrates report generation for all stores.
+
     This function manages the entire report generation process by:
     1. Creating a report record with 'Running' status
     2. Collecting all unique store IDs from the database
-    3. Distributing store processing across multiple processes
+    3. Computing all store metrics in one vectorized pass
     4. Compiling results into a CSV report
     5. Updating the report status to 'Complete' or 'Error'
-    
+
     Args:
         report_id: Unique identifier for the report being generated
-        
+
     Note:
         This function runs asynchronously and updates the database with
-        progress and final results. It uses ProcessPoolExecutor for
-        parallel processing of individual stores.
+        progress and final results.
     """
 
     start_time = timer.time() # Start timer for performance measurement
 
-    db = SessionLocal()
-    print(f"\n🚀 Parallel report generation task started for report_id: {report_id}")
+    # The worker session shares a dedicated compiled-statement cache so the
+    # report's repeated queries skip recompilation (see ReportSessionLocal).
+    db = ReportSessionLocal()
+    print(f"\n🚀 Report generation task started for report_id: {report_id}")
     try:
-        report_record = StoreReport(report_id=str(report_id), status='Running', created_at=datetime.utcnow())
-        store_report_crud.create(db, report_record)
+        # Fingerprint the source data first: the report is a pure function
+        # of the loaded dataset, so a completed report carrying the same
+        # fingerprint can be reused wholesale instead of recomputed. The
+        # same aggregate scan supplies the window end, so the report is
+        # always computed against the snapshot its fingerprint describes -
+        # even on the first trigger after a data reload. The Running row
+        # itself was inserted by the trigger endpoint; only the fingerprint
+        # is stamped here.
+        fingerprint, max_timestamp = store_status_crud.get_data_fingerprint(db)
+        store_report_crud.set_fingerprint(db, report_id, fingerprint)
 
-        all_store_ids = list(set(store_timezone_crud.get_by_column(db, 'store_id')) | \
-                        set(store_business_hours_crud.get_by_column(db, 'store_id')) | \
-                        set(store_status_crud.get_by_column(db, 'store_id')))
-        print(f"Found {len(all_store_ids)} unique stores to process.")
+        cached = store_report_crud.get_completed_by_fingerprint(db, fingerprint)
+        if cached is not None:
+            store_report_crud.update_report(db, report_id, 'Complete',
+                                            cached.report_data, cached.report_data_json)
+            print(f"♻️  Report {report_id} served from an identical completed report.")
+            return
 
-        max_timestamp_utc_str = store_status_crud.get_max_timestamp(db)
-        if ' UTC' in max_timestamp_utc_str:
-            max_timestamp_utc = datetime.strptime(max_timestamp_utc_str, '%Y-%m-%d %H:%M:%S.%f %Z')
-        else:
-            max_timestamp_utc = datetime.fromisoformat(max_timestamp_utc_str)
-        if max_timestamp_utc.tzinfo is None:
-            max_timestamp_utc = pytz.utc.localize(max_timestamp_utc)
+        # One UNION query returns each distinct store id exactly once;
+        # the database deduplicates while merging instead of shipping
+        # three full columns into Python for a set union.
+        all_store_ids = get_all_store_ids(db)
+        print(f"Found {len(all_store_ids)} unique stores to process.")
 
-        tasks = [(store_id, max_timestamp_utc) for store_id in all_store_ids]
+        # Fetch timezone and business-hours data for every store up front in
+        # a single tagged round trip, instead of one query per store.
+        tz_by_store, hours_by_store = get_report_reference_data(db)
 
-        results = []
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            for i, result in enumerate(executor.map(process_single_store, tasks), start=1):
-                print(f"({i}/{len(tasks)}) Processing store id: {tasks[i-1][0]}")
-                results.append(result)
+        # Bulk-load the report window's status polls once; only the trailing
+        # week is relevant.
+        polls_df = store_status_crud.get_all_status_since(db, max_timestamp - 7 * 86400)
 
-        final_report_data = [res for res in results if res is not None]
+        # Compute every store's metrics in a single vectorized pass. The
+        # former per-store ProcessPoolExecutor fan-out spent most of its
+        # time pickling task tuples; one NumPy/pandas pass over flat arrays
+        # does the same work inside compiled code.
+        final_report_data = compute_report_metrics(
+            all_store_ids, polls_df, tz_by_store, hours_by_store, max_timestamp
+        )
 
         print("\n✅ All stores processed. Compiling and saving the final report...")
         total_time = timer.time() - start_time
         print(f"🕒 Report generation completed in {total_time:.2f} seconds.")
-        df = pd.DataFrame(final_report_data)
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False)
-        csv_data = csv_buffer.getvalue()
+        # Serialize the list of row dicts with the csv module directly;
+        # round-tripping through a DataFrame would re-infer dtypes and copy
+        # every column just to write text. The rows stream straight through
+        # a gzip encoder, so only the compressed bytes are ever buffered -
+        # peak memory is the compressed size, not the full CSV text.
+        gz_buffer = io.BytesIO()
+        with gzip.GzipFile(fileobj=gz_buffer, mode='wb') as gz:
+            with io.TextIOWrapper(gz, encoding='utf-8', newline='') as text:
+                writer = csv.DictWriter(text, fieldnames=REPORT_FIELDS)
+                writer.writeheader()
+                writer.writerows(final_report_data)
+        csv_data = gz_buffer.getvalue()
+
+        # Persist the rows pre-serialized as JSON alongside the CSV, so the
+        # JSON response format is a stored-blob read instead of a
+        # per-request re-encode.
+        json_data = orjson.dumps(final_report_data)
 
-        store_report_crud.update_report(db, str(report_id), 'Complete', csv_data)
+        store_report_crud.update_report(db, report_id, 'Complete', csv_data, json_data)
         print(f"🎉 Report {report_id} is complete and saved to the database!")
-        
+
     except Exception as e:
         print(f"\n❌ An error occurred during report generation: {e}")
-        store_report_crud.update_report(db, str(report_id), 'Error', str(e))
+        store_report_crud.update_report(db, report_id, 'Error', gzip.compress(str(e).encode()))
     finally:
         db.close()
 
-def get_report_status(report_id: str) -> tuple[str, str | None]:
+def get_report_status(report_id: str) -> tuple[str, bytes | None, bytes | None]:
     """
     Retrieve the current status and data of a report.
-    
+
     This function checks the database for a report's current status
     and returns the data if the report is complete.
-    
+
     Args:
         report_id: Unique identifier for the report
-        
+
     Returns:
-        tuple: (status, data) where:
+        tuple: (status, data, data_json) where:
             - status: 'Running', 'Complete', or 'Not Found'
-            - data: CSV content if complete, None otherwise
+            - data: gzip-compressed CSV content if complete, None otherwise
+            - data_json: Pre-serialized JSON report rows if complete, None otherwise
     """
     # Create a new database session for this query
     db = SessionLocal()
@@ -230,10 +437,12 @@ def get_report_status(report_id: str) -> tuple[str, str | None]:
         # Look up the report by ID
         report = store_report_crud.get_report_by_id(db, report_id)
         if not report:
-            return "Not Found", None
-        
-        # Return status and data (data will be None if not complete)
-        return str(report.status), str(report.report_data)
+            return "Not Found", None, None
+
+        # Both blobs are passed through exactly as stored - no decompression,
+        # decoding or str() copies here. The CSV stays gzip-compressed and is
+        # served with Content-Encoding: gzip by the endpoint.
+        return report.status, report.report_data, report.report_data_json
     finally:
         # Always close the database session
-        db.close()
\ No newline at end of file
+        db.close()